@@ -1,14 +1,59 @@
 import click
-import pandas as pd
+import polars as pl
+import fastexcel
+import xlsxwriter
 import OpenOPC
 import time
 import logging
 import sys
-import gc
-from datetime import datetime
+import os
+import signal
+import glob
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import date, datetime
 
 VERSION = "1.1.1"
 
+# Name of the OPC group the tags of a batch are registered under
+OPC_GROUP = "dvmon"
+
+# Tag column as the tags are sent to the OPC server, without surrounding whitespace
+TAG_KEY = pl.col('Tag').cast(pl.String).str.strip_chars()
+
+# Columns of the values read for a batch. Values are converted to strings one by one, so
+# that any type OpenOPC returns (dates, arrays, bytes, big integers) fits the schema and
+# batches with different value types compare equal across runs. XLSX tag files are
+# written from the values as OpenOPC returned them, not from this text.
+VALUES_SCHEMA = {'Tag': pl.String, 'Value': pl.String, 'Status': pl.String, 'Timestamp': pl.String}
+
+# Value column as compared for change detection. Excel stores every number as a float and
+# calamine reads booleans as 'true', so values read back from an XLSX tag file as '5.0' or
+# 'true' have to match a new reading of '5' or 'True'.
+VALUE_KEY = (
+    pl.col('Value')
+    .str.replace(r'^([+-]?[0-9]+)\.0$', '${1}')
+    .replace({'true': 'True', 'false': 'False'})
+)
+
+# OPC timestamps as strptime parses '%m/%d/%y %H:%M:%S': one or two digit fields,
+# except the year, and a space-padded day. Digits are ASCII only.
+OPC_TIMESTAMP_PATTERN = (
+    r'^(?<month>1[0-2]|0[1-9]|[1-9])/(?<day>3[01]|[12][0-9]|0[1-9]|[1-9]| [1-9])/(?<year>[0-9]{2})'
+    r'\s+(?<hour>2[0-3]|[01][0-9]|[0-9]):(?<minute>[0-5][0-9]|[0-9]):(?<second>[0-5][0-9]|[0-9])$'
+)
+
+# XLSX cell formats of temporal columns, the ones DataFrame.write_excel uses
+XLSX_DTYPE_FORMATS = {pl.Datetime: 'yyyy-mm-dd hh:mm:ss', pl.Date: 'yyyy-mm-dd;@', pl.Time: 'hh:mm:ss;@'}
+
+# Number of batches that may wait for the writer thread before reads are held back
+WRITE_QUEUE_SIZE = 2
+
+# Weight of the latest read time in the moving average used by adaptive batching
+READ_TIME_SMOOTHING = 0.3
+
 INFO_MESSAGE = """
 This tool was designed to run an OPC Reader utility to get values from DeltaV OPC Server in burst modes.
 It then saves the data into the same CSV/XLSX file it was provided with. The input file must contain a column named "Tag".
@@ -21,9 +66,23 @@ It then saves the data into the same CSV/XLSX file it was provided with. The inp
 
 - --maxtagsperinterval: Provide a number that will be used to read the tags in burst mode.
 
-- --intervalseconds: Provide a number in seconds that will be used to wait until the next burst runs.
+- --intervalseconds: Provide a number in seconds that will be used to wait until the next burst runs. With --adaptive
+  (the default) this is only an upper bound: the next burst starts as soon as the previous reads allow, so a single
+  connection reads batches back to back. Use --no-adaptive to always wait the full interval between bursts.
+
+- --connections: Provide the number of OPC connections used to read batches concurrently (default 1).
+
+- --flushbatches: Provide the number of batches after which the values are written to the tag file (default 10).
 
-- --disconnect_wait_time : Wait time for the OPC Conn to get disconnected.
+- --logfile: Provide a CSV file, or a directory ending in .parquet, to append the values of every batch to, with
+  the time they were logged. A Parquet log gets a new part file every --flushbatches batches and on exit.
+  The tag file is then only read and never rewritten.
+
+- --readsize: Provide the maximum number of tags OpenOPC sends to the server in one request; larger batches
+  are split into sub-groups of this size (default: the whole batch in one request).
+
+- --adaptive / --no-adaptive: Start the next batch as soon as the previous reads allow, using the interval
+  only as an upper bound (default), or always wait for the full interval after each batch.
 
 """
 
@@ -37,174 +96,600 @@ def setup_logging():
     )
     return logging.getLogger(__name__)
 
+def _read_file(filepath):
+    """
+    Reads the CSV or XLSX tag file into a DataFrame.
+    """
+    if filepath.endswith('.xlsx'):
+        return pl.read_excel(filepath, engine='calamine', schema_overrides={'Tag': pl.String})
+    elif filepath.endswith('.csv'):
+        # Polars memory-maps the file from its path. Reading every column as text
+        # skips the type inference pass and keeps the cells as they were written.
+        return pl.read_csv(filepath, infer_schema=False)
+    else:
+        raise ValueError("Unsupported file format. Please provide a .xlsx or .csv file.")
+
+def _scan_tags(filepath):
+    """
+    Lazily reads the CSV or XLSX tag file so that only the 'Tag' column is parsed.
+    """
+    if filepath.endswith('.xlsx'):
+        try:
+            return pl.read_excel(
+                filepath, engine='calamine', columns=['Tag'], schema_overrides={'Tag': pl.String}
+            ).lazy()
+        except fastexcel.ColumnNotFoundError:
+            # Reported as a missing 'Tag' column by read_tags
+            return pl.LazyFrame()
+    elif filepath.endswith('.csv'):
+        return pl.scan_csv(filepath, infer_schema=False)
+    else:
+        raise ValueError("Unsupported file format. Please provide a .xlsx or .csv file.")
+
 def read_tags(filepath):
     """
     Reads an Excel or CSV file containing a 'Tag' column.
-    Returns a list of tag strings.
+    Returns a list of unique, non-empty tag strings with surrounding whitespace removed.
     """
     try:
-        if filepath.endswith('.xlsx'):
-            df = pd.read_excel(filepath, engine='openpyxl')
-        elif filepath.endswith('.csv'):
-            df = pd.read_csv(filepath)
-        else:
-            raise ValueError("Unsupported file format. Please provide a .xlsx or .csv file.")
+        lf = _scan_tags(filepath)
+        columns = lf.collect_schema().names()
     except Exception as e:
         raise ValueError(f"Error reading the tag file: {e}")
 
-    if 'Tag' not in df.columns:
+    if 'Tag' not in columns:
         raise ValueError("The input file must contain a 'Tag' column.")
 
-    return df['Tag'].tolist()
+    try:
+        # Selecting only Tag lets the CSV scan skip parsing every other column;
+        # the comparison is null for missing tags, so one filter drops those too
+        tags = (
+            lf.select(TAG_KEY)
+            .filter(pl.col('Tag') != '')
+            .unique(maintain_order=True)
+            .collect(engine='streaming')
+        )
+    except Exception as e:
+        raise ValueError(f"Error reading the tag file: {e}")
+    return tags.get_column('Tag').to_list()
 
-def parse_timestamp(raw_ts):
+def read_values(df):
     """
-    Convert the OPC timestamp string (e.g. '06/24/07 17:44:43') 
-    to the format "DD-MM-YYYY HH:MM:SS AM/PM".
-    
-    If the timestamp from OPC has a different format, adjust accordingly.
+    Returns the values already stored in the tag DataFrame by a previous run,
+    as a DataFrame with one row per tag and the columns of VALUES_SCHEMA.
     """
-    try:
-        # The original OPC timestamp is typically in the format: mm/dd/yy HH:MM:SS
-        dt = datetime.strptime(raw_ts, '%m/%d/%y %H:%M:%S')
-        return dt.strftime('%d-%m-%Y %I:%M:%S %p')
-    except ValueError:
-        # If parsing fails or format is different, return as-is or handle differently.
-        return raw_ts
-
-def write_values(filepath, tag_values_map):
+    if not {'Tag', 'Value', 'Status', 'Timestamp'}.issubset(df.columns):
+        return pl.DataFrame(schema=VALUES_SCHEMA)
+
+    return (
+        df.select(TAG_KEY, *(pl.col(column).cast(pl.String) for column in ['Value', 'Status', 'Timestamp']))
+        .drop_nulls('Tag')
+        .unique(subset='Tag', keep='first', maintain_order=True)
+    )
+
+def values_frame(values):
+    """
+    Builds a DataFrame with the columns of VALUES_SCHEMA from the
+    (tag, value, status, timestamp) tuples returned by OpenOPC, with the
+    timestamps converted to the requested format.
     """
-    Writes the provided tag information into the same file as columns:
+    rows = ((tag, _as_text(value), status, _as_text(timestamp)) for tag, value, status, timestamp in values)
+    df = pl.DataFrame(rows, schema=VALUES_SCHEMA, orient='row')
+    return df.with_columns(FORMATTED_TIMESTAMP)
+
+def _as_text(value):
+    return None if value is None else str(value)
+
+def _xlsx_cell(value):
+    """
+    Returns an OPC value as it is written to an XLSX cell. Strings, booleans,
+    floats, dates and integers that an Excel number holds exactly keep their
+    type; anything else (arrays, bytes, larger integers) is written as its text.
+    """
+    if isinstance(value, int) and not isinstance(value, bool) and abs(value) > 2 ** 53:
+        return str(value)
+    if value is None or isinstance(value, (str, bool, int, float, date)):
+        return value
+    return str(value)
+
+def read_raw_values(df):
+    """
+    Returns the values of an XLSX tag DataFrame as they were read, by stripped
+    tag, so cells that are not read again keep their type when the file is written.
+    """
+    if 'Value' not in df.columns:
+        return {}
+    return dict(zip(df.select(TAG_KEY).to_series().to_list(), df.get_column('Value').to_list()))
+
+def _format_timestamps():
+    """
+    Returns an expression converting the OPC timestamp strings in the
+    'Timestamp' column (e.g. '06/24/07 17:44:43') to the format
+    "DD-MM-YYYY HH:MM:SS AM/PM".
+
+    The original OPC timestamp is in the format mm/dd/yy HH:MM:SS. The fields
+    are extracted with one regular expression that accepts what strptime
+    accepts for that format, so the conversion runs in Polars instead of
+    parsing every string in Python. Timestamps that strptime would reject,
+    including impossible dates such as 02/30, are returned as-is.
+    """
+    raw = pl.col('Timestamp')
+    fields = raw.str.extract_groups(OPC_TIMESTAMP_PATTERN)
+    month, day, year, hour, minute, second = (
+        fields.struct.field(name).str.strip_chars_start().cast(pl.Int32)
+        for name in ('month', 'day', 'year', 'hour', 'minute', 'second')
+    )
+    # Two-digit years follow strptime: 69-99 are 19xx, 00-68 are 20xx
+    full_year = pl.when(year < 69).then(year + 2000).otherwise(year + 1900)
+    valid = day <= pl.date(full_year, month, 1).dt.month_end().dt.day()
+
+    def two_digits(value):
+        return value.cast(pl.String).str.zfill(2)
+
+    formatted = pl.concat_str([
+        two_digits(day), pl.lit('-'), two_digits(month), pl.lit('-'), full_year.cast(pl.String), pl.lit(' '),
+        two_digits((hour + 11) % 12 + 1), pl.lit(':'), two_digits(minute), pl.lit(':'), two_digits(second), pl.lit(' '),
+        pl.when(hour < 12).then(pl.lit('AM')).otherwise(pl.lit('PM')),
+    ])
+    return pl.when(valid).then(formatted).otherwise(raw).alias('Timestamp')
+
+# Timestamp column in the requested format, built once and reused for every batch
+FORMATTED_TIMESTAMP = _format_timestamps()
+
+def update_values(df, changes):
+    """
+    Updates the provided tag information in the DataFrame as columns:
     'Value', 'Status', 'Timestamp'.
 
-    :param filepath: The original file path (CSV or XLSX).
-    :param tag_values_map: A dict mapping tag -> (value, status, timestamp_in_requested_format).
+    :param df: The tag DataFrame held in memory.
+    :param changes: A DataFrame with the columns of VALUES_SCHEMA, one row per tag.
+    :return: The updated DataFrame.
     """
+    # Create the columns if they don't exist yet
+    df = df.with_columns(
+        pl.lit(None).alias(column)
+        for column in ['Value', 'Status', 'Timestamp']
+        if column not in df.columns
+    )
+    df = df.with_columns(TAG_KEY.alias('_tag_key'))
+
+    # Join the new values onto the matching rows by the stripped Tag
+    updates = changes.rename({'Tag': '_tag_key'})
+    return df.update(updates, on='_tag_key', how='left', include_nulls=True).drop('_tag_key')
+
+def write_file(filepath, df, raw_values=None):
+    """
+    Writes the DataFrame back to the original CSV or XLSX file.
+    The data is written to a temporary file next to it first and then moved
+    over the original, so a crash never leaves a half-written tag file.
+    XLSX rows are streamed to the sheet one at a time, so the workbook is not
+    kept in memory while it is written. The Value cells of the tags in
+    `raw_values` are written from the values as OpenOPC returned them.
+    """
+    root, ext = os.path.splitext(filepath)
+    tmp_path = f"{root}.tmp{ext}"
     try:
         if filepath.endswith('.xlsx'):
-            # Read existing Excel file
-            df = pd.read_excel(filepath, engine='openpyxl')
-        elif filepath.endswith('.csv'):
-            # Read existing CSV file
-            df = pd.read_csv(filepath)
+            value_column = df.columns.index('Value') if 'Value' in df.columns else None
+            if value_column is not None and raw_values:
+                tags = df.select(TAG_KEY).to_series().to_list()
+                cell_values = [
+                    raw_values[tag] if tag in raw_values else value
+                    for tag, value in zip(tags, df.get_column('Value').to_list())
+                ]
+            elif value_column is not None:
+                cell_values = df.get_column('Value').to_list()
+            options = {'constant_memory': True, 'remove_timezone': True, 'nan_inf_to_errors': True}
+            with xlsxwriter.Workbook(tmp_path, options) as workbook:
+                worksheet = workbook.add_worksheet()
+                # Without a cell format, dates and times would be written as plain serial numbers
+                formats = [
+                    workbook.add_format({'num_format': XLSX_DTYPE_FORMATS[dtype.base_type()]})
+                    if dtype.base_type() in XLSX_DTYPE_FORMATS else None
+                    for dtype in df.dtypes
+                ]
+                datetime_format = workbook.add_format({'num_format': XLSX_DTYPE_FORMATS[pl.Datetime]})
+                date_format = workbook.add_format({'num_format': XLSX_DTYPE_FORMATS[pl.Date]})
+                worksheet.write_row(0, 0, df.columns)
+                for row_number, row in enumerate(df.iter_rows(), 1):
+                    for column, value in enumerate(row):
+                        cell_format = formats[column]
+                        if column == value_column:
+                            value = _xlsx_cell(cell_values[row_number - 1])
+                            if isinstance(value, datetime):
+                                cell_format = datetime_format
+                            elif isinstance(value, date):
+                                cell_format = date_format
+                        worksheet.write(row_number, column, value, cell_format)
         else:
-            raise ValueError("Unsupported file format. Please provide a .xlsx or .csv file.")
-
-        # Create the columns if they don't exist yet
-        if 'Value' not in df.columns:
-            df['Value'] = None
-        if 'Status' not in df.columns:
-            df['Status'] = None
-        if 'Timestamp' not in df.columns:
-            df['Timestamp'] = None
-
-        # Update each row by matching Tag to the dictionary
-        for index, row in df.iterrows():
-            tag = row['Tag']
-            if tag in tag_values_map:
-                val, status, timestamp_str = tag_values_map[tag]
-                df.at[index, 'Value'] = val
-                df.at[index, 'Status'] = status
-                df.at[index, 'Timestamp'] = timestamp_str
-
-        # Write the updated DataFrame back to the file
-        if filepath.endswith('.xlsx'):
-            df.to_excel(filepath, index=False, engine='openpyxl')
-        else:
-            df.to_csv(filepath, index=False)
-
+            df.write_csv(tmp_path)
+        os.replace(tmp_path, filepath)
     except Exception as e:
         raise ValueError(f"Error writing to the tag file: {e}")
 
+class ValueLog:
+    """
+    Appends the values of each batch as new rows to a CSV log file or a Parquet
+    log dataset, so the cost of a write only depends on the batch and not on the
+    size of the log. The log has the columns 'Logged At', 'Tag', 'Value', 'Status',
+    'Timestamp'. A Parquet log is a directory of part files, since Parquet files
+    cannot be appended to; a new part is written every `flush_batches` batches.
+    """
+    def __init__(self, logpath, flush_batches=10):
+        if not logpath.endswith(('.csv', '.parquet')):
+            raise ValueError("Unsupported log file format. Please provide a .csv file or a .parquet directory.")
+        if logpath.endswith('.parquet') and os.path.isfile(logpath):
+            raise ValueError("A Parquet log must be a directory of part files, not a single file.")
+        self.logpath = logpath
+        self.flush_batches = flush_batches
+        self.run_id = datetime.now().strftime('%Y%m%d-%H%M%S-%f')  # Part files of a run sort after earlier runs
+        self.parts = 0
+        self.pending = []  # Parquet rows of the batches not written to a part file yet
+
+    def read_last_values(self):
+        """
+        Returns the last logged values per tag, as a DataFrame with the columns
+        of VALUES_SCHEMA, so a new run only logs values that changed since.
+        """
+        try:
+            if self.logpath.endswith('.parquet'):
+                parts = sorted(glob.glob(os.path.join(self.logpath, '*.parquet')))
+                if not parts:
+                    return pl.DataFrame(schema=VALUES_SCHEMA)
+                lf = pl.scan_parquet(parts)
+            else:
+                if not os.path.exists(self.logpath) or os.path.getsize(self.logpath) == 0:
+                    return pl.DataFrame(schema=VALUES_SCHEMA)
+                lf = pl.scan_csv(self.logpath, infer_schema=False)
+            return (
+                lf.select(pl.col(column).cast(pl.String) for column in VALUES_SCHEMA)
+                .unique(subset='Tag', keep='last', maintain_order=True)
+                .collect(engine='streaming')
+            )
+        except Exception as e:
+            raise ValueError(f"Error reading the log file: {e}")
+
+    def append(self, changes, logged_at):
+        """
+        Appends one row per tag in the changes DataFrame. Returns the number of
+        batches written to the log, which is 0 while Parquet rows are collected.
+        """
+        rows = changes.select(pl.lit(logged_at).alias('Logged At'), pl.all())
+        if self.logpath.endswith('.parquet'):
+            self.pending.append(rows)
+            return self.flush() if len(self.pending) >= self.flush_batches else 0
+
+        try:
+            write_header = not os.path.exists(self.logpath) or os.path.getsize(self.logpath) == 0
+            with open(self.logpath, 'a', newline='', encoding='utf-8') as f:
+                rows.write_csv(f, include_header=write_header)
+        except Exception as e:
+            raise ValueError(f"Error appending to the log file: {e}")
+        return 1
+
+    def flush(self):
+        """
+        Writes the collected Parquet rows as a new part file of the log dataset.
+        The part is written under a temporary name and then renamed, so the
+        dataset never holds a partial part file. Returns the number of batches written.
+        """
+        if not self.pending:
+            return 0
+        path = os.path.join(self.logpath, f"part-{self.run_id}-{self.parts:05d}.parquet")
+        try:
+            os.makedirs(self.logpath, exist_ok=True)
+            pl.concat(self.pending).write_parquet(f"{path}.tmp")
+            os.replace(f"{path}.tmp", path)
+        except Exception as e:
+            raise ValueError(f"Error appending to the log file: {e}")
+        batches = len(self.pending)
+        self.pending = []
+        self.parts += 1
+        return batches
+
+    def close(self):
+        """
+        Writes the Parquet rows still collected. Returns the number of batches written.
+        """
+        return self.flush()
+
+class OPCConnectionError(Exception):
+    """
+    Raised when a connection to the OPC server cannot be opened, which stops the run.
+    Errors raised while reading, including socket errors, only fail their batch.
+    """
+
+def _raise_keyboard_interrupt(signum, frame):
+    raise KeyboardInterrupt
+
 class OPCHandler:
-    def __init__(self, servername, maxtags, interval, tags, filepath, logger, disconnect_wait_time):
+    def __init__(self, servername, maxtags, interval, tags, filepath, logger, connections=1, flush_batches=10, logfile=None, adaptive=True, read_size=None):
         self.servername = servername
         self.maxtags = maxtags
         self.interval = interval
         self.tags = tags
         self.filepath = filepath
         self.logger = logger
-        self.disconnect_wait_time = disconnect_wait_time
-        self.opc = None  # Initialize OPC client as None
-
-    def connect(self):
+        self.connections = connections
+        self.adaptive = adaptive
+        self.read_size = read_size  # Tags per OPC request within a batch, None for the whole batch
+        self.flush_batches = flush_batches
+        self.unflushed_batches = 0
+        # When a log file is given, values are appended there and the tag file is left untouched
+        self.value_log = ValueLog(logfile, flush_batches) if logfile else None
+        # Tag file held in memory and flushed every flush_batches writes, only read when it is written to
+        self.df = None if self.value_log else _read_file(filepath)
+        # Values of an XLSX tag file by tag as read from OPC or the file, so cells keep their type
+        self.raw_values = read_raw_values(self.df) if self.df is not None and filepath.endswith('.xlsx') else None
+        self.clients = [None] * connections  # One OPC client slot per connection, kept open for the run
+        self.client_locks = [threading.Lock() for _ in range(connections)]
+        # One single-thread executor per connection, so each COM client is only used by the thread that created it
+        self.executors = []
+        # Last known values per tag, from the log when values are logged there
+        self.last_values = self.value_log.read_last_values() if self.value_log else read_values(self.df)
+        # Bounded so reads can run at most WRITE_QUEUE_SIZE batches ahead of the writer
+        self.write_queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        self.writer = None
+        self.total_batches = 0
+
+    def connect(self, index=0):
+        """
+        Opens the OPC client of a connection. Raises OPCConnectionError when the
+        server cannot be reached, which stops the run.
+        """
         try:
-            # Reinitialize OPC client for each batch
-            self.opc = OpenOPC.client()
-            self.opc.connect(self.servername)
-            self.logger.info(f"Connected to OPC server: {self.servername}")
+            opc = OpenOPC.client()
+            opc.connect(self.servername)
         except Exception as e:
-            self.logger.error(f"Failed to connect to OPC server: {e}")
-            sys.exit(1)
+            raise OPCConnectionError(f"Failed to connect to OPC server: {e}")
+        self.clients[index] = opc
+        self.logger.info("Connected to OPC server: %s (connection %d)", self.servername, index + 1)
 
-    def close_connection(self):
+    def close_connection(self, index=0):
         try:
-            if self.opc is not None:
-                self.opc.close()
-                self.logger.info("Closed OPC connection.")
-
-            # Force OPC client deletion and garbage collection
-            del self.opc
-            self.opc = None
-            gc.collect()
-            self.logger.info(f"Waiting {self.disconnect_wait_time} seconds before reconnecting...")
-            time.sleep(self.disconnect_wait_time)  # Allow DeltaV to release the tag allocation
+            if self.clients[index] is not None:
+                self.clients[index].close()
+                self.logger.info("Closed OPC connection %d.", index + 1)
 
         except Exception as e:
-            self.logger.error(f"Error closing OPC connection: {e}")
+            self.logger.error("Error closing OPC connection: %s", e)
+        finally:
+            self.clients[index] = None
 
-    def run(self):
+    def shutdown_connections(self):
         """
-        Reads tags in batches while respecting the maxtags limit and interval.
-        Each batch establishes a fresh OPC connection, reads the tags, writes data, 
-        closes the connection, and waits for a specified time before the next batch.
+        Closes every OPC connection on its own worker thread, after the batch it
+        may still be reading, and stops the worker threads.
         """
-        total_tags = len(self.tags)
-        batches = [self.tags[i:i+self.maxtags] for i in range(0, total_tags, self.maxtags)]
-        total_batches = len(batches)
-        current_batch = 1
+        for index, executor in enumerate(self.executors):
+            executor.submit(self.close_connection, index)
+        for executor in self.executors:
+            executor.shutdown(wait=True)
+        self.executors = []
 
-        while current_batch <= total_batches:
-            self.logger.info(f"Processing batch {current_batch} of {total_batches}")
-            batch = batches[current_batch - 1]
+    def start_writer(self):
+        """
+        Starts the background thread that writes changed values back to the file,
+        so OPC reads never wait on file I/O.
+        """
+        self.writer = threading.Thread(target=self._write_worker, name="OPCLoggerWriter", daemon=True)
+        self.writer.start()
 
-            self.connect()
+    def stop_writer(self):
+        """
+        Waits for the pending writes to finish and stops the writer thread.
+        """
+        if self.writer is not None:
+            self.write_queue.put(None)
+            self.writer.join()
+            self.writer = None
+
+    def _write_worker(self):
+        while True:
+            item = self.write_queue.get()
+            if item is None:
+                break
+            current_batch, logged_at, changes, rows = item
             try:
-                tag_values_map = {}
-
-                # Read the current batch of tags
-                values = self.opc.read(batch)
-                self.logger.info(f"Read values for batch {current_batch}: {values}")
+                if self.value_log is not None:
+                    written = self.value_log.append(changes, logged_at)
+                    if written:
+                        self.logger.info("Successfully appended values of %d batch(es) to %s", written, self.value_log.logpath)
+                    continue
+
+                self.df = update_values(self.df, changes)
+                if self.raw_values is not None:
+                    self.raw_values.update((tag, value) for tag, value, *_ in rows)
+                self.unflushed_batches += 1
+                if self.unflushed_batches >= self.flush_batches:
+                    self.flush()
+            except Exception as e:
+                self.logger.error("Error during OPC write of batch %d: %s", current_batch, e)
 
-                # Populate the dictionary
-                for (tag, val, status, ts_string) in values:
-                    formatted_ts = parse_timestamp(ts_string)
-                    tag_values_map[tag] = (val, status, formatted_ts)
+        # Write whatever is still pending on shutdown
+        try:
+            if self.unflushed_batches:
+                self.flush()
+            if self.value_log is not None:
+                written = self.value_log.close()
+                if written:
+                    self.logger.info("Successfully appended values of %d batch(es) to %s", written, self.value_log.logpath)
+        except Exception as e:
+            self.logger.error("Error during OPC write: %s", e)
 
-                # Write values to the original file
-                write_values(self.filepath, tag_values_map)
-                self.logger.info(f"Successfully wrote values for batch {current_batch} to {self.filepath}")
+    def flush(self):
+        """
+        Writes the in-memory tag DataFrame back to the tag file.
+        """
+        write_file(self.filepath, self.df, self.raw_values)
+        self.logger.info("Successfully wrote values of %d batch(es) to %s", self.unflushed_batches, self.filepath)
+        self.unflushed_batches = 0
 
-            except KeyboardInterrupt:
-                self.logger.info("Stopping OPC Logger due to KeyboardInterrupt.")
-                self.close_connection()
-                sys.exit(0)
+    def _read_one_batch(self, index, current_batch, batch):
+        """
+        Reads one batch of tags on the given connection. Runs on the connection's
+        worker thread; the connection lock keeps a client from being shared by two
+        batches. The connection is opened on first use and stays open for the run,
+        unless a read fails; it is then closed and reopened for the next batch.
+        Returns the values as OpenOPC returned them, as a DataFrame (see
+        values_frame) and the time the read took in seconds.
+        """
+        with self.client_locks[index]:
+            self.logger.info("Processing batch %d of %d on connection %d", current_batch, self.total_batches, index + 1)
+            if self.clients[index] is None:
+                self.connect(index)
+            opc = self.clients[index]
+
+            # Read the batch of tags in one grouped synchronous request per read_size tags
+            # (OpenOPC keeps them as sub-groups of the batch group). While this thread
+            # reads, the writer thread writes the previous batches from the bounded queue.
+            group = f"{OPC_GROUP}_{current_batch}"
+            start = time.monotonic()
+            try:
+                rows = opc.read(batch, group=group, size=self.read_size, pause=0, sync=True)
+                values = values_frame(rows)
+            except Exception:
+                # The server may have dropped the session, so the next batch on this connection reconnects
+                self.close_connection(index)
+                raise
+            read_time = time.monotonic() - start
+
+            # Release the batch's items on the server, instead of reconnecting
+            try:
+                opc.remove(group)
             except Exception as e:
-                self.logger.error(f"Error during OPC read/write: {e}")
-            finally:
-                # Close OPC connection
-                self.close_connection()
+                self.logger.warning("Could not remove OPC group %s: %s", group, e)
+            return rows, values, read_time
+
+    def _queue_changes(self, current_batch, batch_values, rows):
+        """
+        Queues the values of a batch that changed since they were last stored.
+        Blocks while the writer thread is WRITE_QUEUE_SIZE batches behind.
+        """
+        logged_at = datetime.now().strftime('%d-%m-%Y %I:%M:%S %p')
+        keys = ['Tag', VALUE_KEY, 'Status', 'Timestamp']
+        changes = batch_values.join(self.last_values, left_on=keys, right_on=keys, how='anti', nulls_equal=True)
+        self.last_values = pl.concat([self.last_values.join(changes, on='Tag', how='anti'), changes])
+
+        if changes.height:
+            self.write_queue.put((current_batch, logged_at, changes, rows))
+        else:
+            self.logger.info("No value changes in batch %d, skipping write.", current_batch)
+
+    def _complete_batch(self, current_batch, future):
+        """
+        Queues the changed values of a finished batch read. Returns the time
+        the read took, or None if it failed. An OPCConnectionError is re-raised.
+        """
+        try:
+            rows, values, read_time = future.result()
+            self.logger.info("Read values for batch %d: %s", current_batch, rows)
+            self._queue_changes(current_batch, values, rows)
+            return read_time
+        except OPCConnectionError:
+            raise
+        except Exception as e:
+            self.logger.error("Error during OPC read of batch %d: %s", current_batch, e)
+            return None
 
-            if current_batch < total_batches:
-                self.logger.info(f"Waiting for {self.interval} seconds before next batch.")
-                try:
-                    time.sleep(self.interval)
-                except KeyboardInterrupt:
-                    self.logger.info("Stopping OPC Logger during sleep due to KeyboardInterrupt.")
-                    sys.exit(0)
+    def _drain_batches(self, outstanding):
+        """
+        Waits for the batches still being read and queues their changed values,
+        when the run stops early. Connections that fail as well are only logged.
+        """
+        for future, (index, current_batch) in outstanding.items():
+            try:
+                self._complete_batch(current_batch, future)
+            except OPCConnectionError as e:
+                self.logger.error("Error during OPC read of batch %d: %s", current_batch, e)
 
-            current_batch += 1
+    def run(self):
+        """
+        Reads tags in batches while respecting the maxtags limit and interval.
+        Up to `connections` batches are read concurrently, each on its own OPC
+        connection. Connections stay open for the whole run; each batch is read
+        through its own OPC group, which is removed again after the read.
+        Without `adaptive`, the next batch starts after waiting for the interval
+        once a batch completes. With `adaptive`, batches are started as soon as a
+        connection is free, spaced by the moving average of the read time but
+        never more than the interval apart.
+        Only values that changed since they were last stored are handed to the
+        writer thread. It either appends them to the log file, or updates the
+        tag file in memory and flushes it to disk every `flush_batches` batches
+        and on shutdown.
+        """
+        total_tags = len(self.tags)
+        batch_starts = range(0, total_tags, self.maxtags)
+        self.total_batches = len(batch_starts)
+
+        self.start_writer()
 
+        # Treat SIGTERM like Ctrl+C so pending values are still flushed to the file
+        signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+
+        self.executors = [
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"OPCLoggerRead{index + 1}")
+            for index in range(self.connections)
+        ]
+        # Batches are sliced from self.tags only when they are submitted
+        pending = enumerate(batch_starts, 1)
+        next_batch = next(pending, None)
+        free_connections = deque(range(self.connections))
+        outstanding = {}  # future -> (connection index, batch number)
+        read_time_ema = None
+        next_submit = time.monotonic()
+        try:
+            while next_batch is not None or outstanding:
+                # Start batches while a connection is free and the next batch is due
+                now = time.monotonic()
+                while next_batch is not None and free_connections and now >= next_submit:
+                    index = free_connections.popleft()
+                    current_batch, start = next_batch
+                    batch = self.tags[start:start + self.maxtags]
+                    next_batch = next(pending, None)
+                    future = self.executors[index].submit(self._read_one_batch, index, current_batch, batch)
+                    outstanding[future] = (index, current_batch)
+                    if self.adaptive and read_time_ema is not None:
+                        next_submit = now + min(self.interval, read_time_ema)
+
+                # Wait for a batch to complete, or until the next batch is due
+                timeout = max(0.0, next_submit - now) if next_batch is not None and free_connections else None
+                if not outstanding:
+                    time.sleep(timeout)
+                    continue
+                done, _ = wait(outstanding, timeout=timeout, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    index, current_batch = outstanding.pop(future)
+                    free_connections.append(index)
+                    read_time = self._complete_batch(current_batch, future)
+                    if read_time is not None:
+                        if read_time_ema is None:
+                            read_time_ema = read_time
+                        else:
+                            read_time_ema = READ_TIME_SMOOTHING * read_time + (1 - READ_TIME_SMOOTHING) * read_time_ema
+
+                    if not self.adaptive and next_batch is not None:
+                        self.logger.info("Waiting for %s seconds before next batch.", self.interval)
+                        next_submit = time.monotonic() + self.interval
+
+        except KeyboardInterrupt:
+            self.logger.info("Stopping OPC Logger due to KeyboardInterrupt.")
+            exit_code = 0
+        except OPCConnectionError as e:
+            self.logger.error("Stopping OPC Logger: %s", e)
+            # Keep the values of the batches the other connections are still reading
+            self._drain_batches(outstanding)
+            exit_code = 1
+        else:
+            exit_code = None
+        finally:
+            # Always close the connections and let the writer flush, whatever stopped the run
+            self.shutdown_connections()
+            self.stop_writer()
+
+        if exit_code is not None:
+            sys.exit(exit_code)
         self.logger.info("All batches processed. Exiting.")
 
 @click.command()
@@ -231,20 +716,52 @@ class OPCHandler:
     '--intervalseconds',
     type=int,
     default=60,
-    help='Provide a number in seconds that will be used to wait until the next burst runs.'
+    help='Provide a number in seconds that will be used to wait until the next burst runs. With --adaptive (default) this is only an upper bound; use --no-adaptive to always wait the full interval.'
 )
 @click.option(
     '--disconnect_wait_time',
     type=int,
     default=10,
-    help='Disconnect Wait time for the Server to Close the Connection.'
+    hidden=True,
+    help='No longer used; connections now stay open for the whole run. Kept for compatibility.'
+)
+@click.option(
+    '--connections',
+    type=click.IntRange(min=1),
+    default=1,
+    help='Number of OPC connections used to read batches concurrently.'
+)
+@click.option(
+    '--flushbatches',
+    type=click.IntRange(min=1),
+    default=10,
+    help='Number of batches after which the values are flushed to the tag file. Pending values are always written on exit.'
+)
+@click.option(
+    '--logfile',
+    type=click.Path(),
+    required=False,
+    default=None,
+    help='Append the values read in each batch to this CSV file or .parquet directory instead of rewriting the tag file.'
+)
+@click.option(
+    '--readsize',
+    type=click.IntRange(min=1),
+    required=False,
+    default=None,
+    help='Maximum number of tags per OPC read request; OpenOPC splits larger batches into requests of this size.'
+)
+@click.option(
+    '--adaptive/--no-adaptive',
+    default=True,
+    help='Start the next batch as soon as the previous reads allow instead of always waiting for the interval.'
 )
 @click.option(
     '--info',
     is_flag=True,
     help='Display information with version about this tool.'
 )
-def main(tagfile, servername, maxtagsperinterval, intervalseconds, disconnect_wait_time, info):
+def main(tagfile, servername, maxtagsperinterval, intervalseconds, disconnect_wait_time, connections, flushbatches, logfile, readsize, adaptive, info):
     if info:
         click.echo(f"OPCLogger Tool Version {VERSION}\n{INFO_MESSAGE}")
         return
@@ -257,20 +774,28 @@ def main(tagfile, servername, maxtagsperinterval, intervalseconds, disconnect_wa
 
     try:
         tags = read_tags(tagfile)
-        logger.info(f"Successfully read {len(tags)} tags from {tagfile}")
+        logger.info("Successfully read %d tags from %s", len(tags), tagfile)
     except Exception as e:
-        logger.error(f"Failed to read tag file: {e}")
+        logger.error("Failed to read tag file: %s", e)
         sys.exit(1)
 
-    opc_handler = OPCHandler(
-        servername=servername,
-        maxtags=maxtagsperinterval,
-        interval=intervalseconds,
-        disconnect_wait_time=disconnect_wait_time,
-        tags=tags,
-        filepath=tagfile,
-        logger=logger
-    )
+    try:
+        opc_handler = OPCHandler(
+            servername=servername,
+            maxtags=maxtagsperinterval,
+            interval=intervalseconds,
+            connections=connections,
+            flush_batches=flushbatches,
+            logfile=logfile,
+            adaptive=adaptive,
+            read_size=readsize,
+            tags=tags,
+            filepath=tagfile,
+            logger=logger
+        )
+    except Exception as e:
+        logger.error("Failed to set up OPC Logger: %s", e)
+        sys.exit(1)
     opc_handler.run()
 
 if __name__ == '__main__':
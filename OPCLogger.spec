@@ -7,7 +7,7 @@ a = Analysis(
     pathex=['.'],                 
     binaries=[],
     datas=[],
-    hiddenimports=['win32timezone'],
+    hiddenimports=['win32timezone', 'fastexcel', 'xlsxwriter'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
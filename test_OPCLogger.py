@@ -0,0 +1,57 @@
+from datetime import datetime
+
+import polars as pl
+import pytest
+
+import OPCLogger
+
+TIMESTAMPS = [
+    '06/24/07 17:44:43',
+    '06/24/07 00:00:00',
+    '12/31/68 23:59:59',   # two-digit year pivot: 68 is 2068
+    '01/01/69 12:00:00',   # ... and 69 is 1969
+    '02/29/08 00:00:00',   # leap day
+    '02/29/07 00:00:00',   # no leap day in 2007
+    '02/30/07 10:00:00',
+    '04/31/07 01:00:00',
+    '6/24/07 17:44:43',    # unpadded fields
+    '6/ 4/07 7:4:3',       # space-padded day
+    '06/24/07  17:44:43',
+    '06/24/07\t17:44:43',
+    '06/24/07 17:44:60',   # second 60
+    '13/01/07 00:00:00',
+    '+6/24/07 17:44:43',   # signs
+    '06/24/07 -0:44:43',
+    ' 6/24/07 17:44:43',
+    '06/24/07 17:44:43x',  # trailing text
+    '2024-06-24 17:44:43+00:00',
+    '',
+]
+
+def _strptime(timestamp):
+    try:
+        return datetime.strptime(timestamp, '%m/%d/%y %H:%M:%S').strftime('%d-%m-%Y %I:%M:%S %p')
+    except ValueError:
+        return timestamp
+
+@pytest.mark.parametrize('timestamp', TIMESTAMPS)
+def test_formatted_timestamp_matches_strptime(timestamp):
+    df = pl.DataFrame({'Timestamp': [timestamp]}).with_columns(OPCLogger.FORMATTED_TIMESTAMP)
+    assert df.item(0, 'Timestamp') == _strptime(timestamp)
+
+def test_formatted_timestamp_keeps_nulls():
+    df = pl.DataFrame({'Timestamp': [None]}, schema={'Timestamp': pl.String}).with_columns(OPCLogger.FORMATTED_TIMESTAMP)
+    assert df.item(0, 'Timestamp') is None
+
+def test_xlsx_cells_keep_opc_values():
+    # Text that looks like a number or a boolean stays text, and integers are not rounded
+    written = ['000123', 'True', True, 5, 1.5, 2**53, 2**60 + 1, (1, 2), None]
+    expected = ['000123', 'True', True, 5, 1.5, 2**53, '1152921504606846977', '(1, 2)', None]
+    assert [OPCLogger._xlsx_cell(value) for value in written] == expected
+
+def test_values_read_back_from_xlsx_are_unchanged():
+    read = OPCLogger.values_frame([('A', 5, 'Good', ''), ('B', True, 'Good', ''), ('C', '000123', 'Good', '')])
+    stored = pl.DataFrame({'Tag': ['A', 'B', 'C'], 'Value': ['5.0', 'true', '123'], 'Status': 'Good', 'Timestamp': ''})
+    keys = ['Tag', OPCLogger.VALUE_KEY, 'Status', 'Timestamp']
+    changes = read.join(stored, left_on=keys, right_on=keys, how='anti', nulls_equal=True)
+    assert changes.get_column('Tag').to_list() == ['C']